@@ -93,9 +93,7 @@ finally:
 # 2. remove the 0.0 version created by setuptools_scm when clone is too shallow
 if on_rtd:
     import re
-    p1 = re.compile(r'\.d\d{8}$')
-    if p1.match(version):
-        version = p1.sub('', version)
+    version = re.sub(r'\.d\d{8}$', '', version)
 
     p2 = re.compile(r'^0\.0\.post\d+\+g')
     if p2.match(version):
@@ -480,13 +478,21 @@ def link_to_tutorials():
     dest_image_dir.mkdir(parents=True, exist_ok=True)
 
     def _make_links(orig_dir, dest_dir, pattern):
-        # Remove any old files
-        for old_file in dest_dir.glob(pattern):
-            old_file.unlink()
+        files = {Path(file).name: file for file in orig_dir.glob(pattern)}
 
-        # Link files for this build
-        for file in orig_dir.glob(pattern):
-            basename = Path(file).name
+        # Remove any old files, but keep the links that still
+        # point to the right files
+        for old_file in dest_dir.glob(pattern):
+            file = files.get(old_file.name)
+            if (file is not None
+                    and old_file.is_symlink()
+                    and os.readlink(old_file) == str(file)):
+                del files[old_file.name]
+            else:
+                old_file.unlink()
+
+        # Link the new files for this build
+        for basename, file in files.items():
             dest = dest_dir / basename
             dest.symlink_to(file)
 
@@ -1,22 +1,38 @@
+"""
+A grammar of graphics for python
+
+The objects that make up the public API are defined in the
+submodules. A submodule is only imported when one of its objects
+is first accessed, so that ``import plotnine`` is cheap.
+"""
+from __future__ import annotations
+
+import sys
+import typing
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
+from types import ModuleType
 
-from .coords import *  # noqa: F401,F403,E261
-from .facets import *  # noqa: F401,F403,E261
-from .geoms import *  # noqa: F401,F403,E261
-from .ggplot import (  # noqa: F401
-    ggplot,
-    ggsave,
-    save_as_pdf_pages,  # noqa: F401
-)
-from .guides import *  # noqa: F401,F403,E261
-from .labels import *  # noqa: F401,F403,E261
-from .mapping import *  # noqa: F401,F403,E261
-from .positions import *  # noqa: F401,F403,E261
-from .qplot import qplot  # noqa: F401
-from .scales import *  # noqa: F401,F403,E261
-from .stats import *  # noqa: F401,F403,E261
-from .themes import *  # noqa: F401,F403,E261
-from .watermark import watermark  # noqa: F401
+if typing.TYPE_CHECKING:
+    from typing import Any
+
+    from .coords import *  # noqa: F401,F403,E261
+    from .facets import *  # noqa: F401,F403,E261
+    from .geoms import *  # noqa: F401,F403,E261
+    from .ggplot import (  # noqa: F401
+        ggplot,
+        ggsave,
+        save_as_pdf_pages,  # noqa: F401
+    )
+    from .guides import *  # noqa: F401,F403,E261
+    from .labels import *  # noqa: F401,F403,E261
+    from .mapping import *  # noqa: F401,F403,E261
+    from .positions import *  # noqa: F401,F403,E261
+    from .qplot import qplot  # noqa: F401
+    from .scales import *  # noqa: F401,F403,E261
+    from .stats import *  # noqa: F401,F403,E261
+    from .themes import *  # noqa: F401,F403,E261
+    from .watermark import watermark  # noqa: F401
 
 try:
     __version__ = version('plotnine')
@@ -27,27 +43,166 @@ finally:
     del version
     del PackageNotFoundError
 
+# The public objects in each submodule
+_SUBMODULE_OBJECTS = {
+    'coords': (
+        'coord_cartesian', 'coord_fixed', 'coord_equal', 'coord_flip',
+        'coord_trans',
+    ),
+    'facets': (
+        'facet_grid', 'facet_null', 'facet_wrap', 'label_value', 'label_both',
+        'label_context', 'labeller', 'as_labeller',
+    ),
+    'geoms': (
+        'annotate', 'annotation_logticks', 'annotation_stripes', 'geom_abline',
+        'geom_area', 'geom_bar', 'geom_bin_2d', 'geom_bin2d', 'geom_blank',
+        'geom_boxplot', 'geom_col', 'geom_count', 'geom_crossbar',
+        'geom_density', 'geom_density_2d', 'geom_dotplot', 'geom_errorbar',
+        'geom_errorbarh', 'geom_freqpoly', 'geom_histogram', 'geom_hline',
+        'geom_jitter', 'geom_label', 'geom_line', 'geom_linerange', 'geom_map',
+        'arrow', 'geom_path', 'geom_point', 'geom_pointdensity',
+        'geom_pointrange', 'geom_quantile', 'geom_qq', 'geom_qq_line',
+        'geom_polygon', 'geom_raster', 'geom_rect', 'geom_ribbon', 'geom_rug',
+        'geom_segment', 'geom_sina', 'geom_smooth', 'geom_spoke', 'geom_step',
+        'geom_text', 'geom_tile', 'geom_violin', 'geom_vline',
+    ),
+    'ggplot': (
+        'ggplot', 'ggsave', 'save_as_pdf_pages',
+    ),
+    'guides': (
+        'guide_colorbar', 'guide_colourbar', 'guide_legend', 'guides',
+    ),
+    'labels': (
+        'xlab', 'ylab', 'labs', 'ggtitle',
+    ),
+    'mapping': (
+        'aes', 'after_stat', 'after_scale', 'stage',
+    ),
+    'positions': (
+        'position_dodge', 'position_dodge2', 'position_fill',
+        'position_identity', 'position_jitter', 'position_jitterdodge',
+        'position_nudge', 'position_stack',
+    ),
+    'qplot': (
+        'qplot',
+    ),
+    'scales': (
+        'scale_color_brewer', 'scale_colour_brewer', 'scale_color_cmap',
+        'scale_colour_cmap', 'scale_color_cmap_d', 'scale_colour_cmap_d',
+        'scale_color_ordinal', 'scale_colour_ordinal',
+        'scale_color_continuous', 'scale_colour_continuous',
+        'scale_color_discrete', 'scale_colour_discrete',
+        'scale_color_distiller', 'scale_colour_distiller',
+        'scale_color_desaturate', 'scale_colour_desaturate',
+        'scale_color_gradient', 'scale_colour_gradient',
+        'scale_color_gradient2', 'scale_colour_gradient2',
+        'scale_color_gradientn', 'scale_colour_gradientn', 'scale_color_grey',
+        'scale_colour_grey', 'scale_color_gray', 'scale_colour_gray',
+        'scale_color_hue', 'scale_colour_hue', 'scale_color_datetime',
+        'scale_colour_datetime', 'scale_fill_brewer', 'scale_fill_cmap',
+        'scale_fill_cmap_d', 'scale_fill_ordinal', 'scale_fill_continuous',
+        'scale_fill_desaturate', 'scale_fill_discrete', 'scale_fill_distiller',
+        'scale_fill_gradient', 'scale_fill_gradient2', 'scale_fill_gradientn',
+        'scale_fill_grey', 'scale_fill_gray', 'scale_fill_hue',
+        'scale_fill_datetime', 'scale_alpha', 'scale_alpha_discrete',
+        'scale_alpha_ordinal', 'scale_alpha_continuous',
+        'scale_alpha_datetime', 'scale_linetype', 'scale_linetype_discrete',
+        'scale_linetype_continuous', 'scale_shape', 'scale_shape_discrete',
+        'scale_shape_continuous', 'scale_size', 'scale_size_area',
+        'scale_size_discrete', 'scale_size_continuous', 'scale_size_ordinal',
+        'scale_size_radius', 'scale_size_datetime', 'scale_stroke',
+        'scale_stroke_continuous', 'scale_stroke_discrete',
+        'scale_alpha_identity', 'scale_color_identity',
+        'scale_colour_identity', 'scale_fill_identity',
+        'scale_linetype_identity', 'scale_shape_identity',
+        'scale_size_identity', 'scale_color_manual', 'scale_colour_manual',
+        'scale_fill_manual', 'scale_shape_manual', 'scale_linetype_manual',
+        'scale_alpha_manual', 'scale_size_manual', 'scale_x_continuous',
+        'scale_x_date', 'scale_x_datetime', 'scale_x_discrete',
+        'scale_x_log10', 'scale_x_reverse', 'scale_x_sqrt',
+        'scale_x_timedelta', 'scale_y_continuous', 'scale_y_date',
+        'scale_y_datetime', 'scale_y_discrete', 'scale_y_log10',
+        'scale_y_reverse', 'scale_y_sqrt', 'scale_y_timedelta', 'xlim', 'ylim',
+        'lims', 'expand_limits',
+    ),
+    'stats': (
+        'stat_count', 'stat_bin', 'stat_bin_2d', 'stat_bin2d', 'stat_bindot',
+        'stat_boxplot', 'stat_density', 'stat_ecdf', 'stat_ellipse',
+        'stat_density_2d', 'stat_function', 'stat_hull', 'stat_identity',
+        'stat_pointdensity', 'stat_qq', 'stat_qq_line', 'stat_quantile',
+        'stat_sina', 'stat_smooth', 'stat_sum', 'stat_summary',
+        'stat_summary_bin', 'stat_unique', 'stat_ydensity',
+    ),
+    'themes': (
+        'element_blank', 'element_line', 'element_rect', 'element_text',
+        'theme', 'theme_538', 'theme_bw', 'theme_classic', 'theme_dark',
+        'theme_gray', 'theme_grey', 'theme_light', 'theme_linedraw',
+        'theme_matplotlib', 'theme_minimal', 'theme_seaborn', 'theme_void',
+        'theme_xkcd', 'theme_tufte', 'theme_get', 'theme_set', 'theme_update',
+    ),
+    'watermark': (
+        'watermark',
+    ),
+}
+
+# object name -> submodule
+_LAZY = {
+    name: module
+    for module, names in _SUBMODULE_OBJECTS.items()
+    for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import public objects from their submodules on first access
 
-def _get_all_imports():
+    Submodules that do not share a name with an object
+    (e.g. ``plotnine.options``) are also imported on first access.
     """
-    Return list of all the imports
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    try:
+        module = _LAZY[name]
+    except KeyError as err:
+        if name.startswith('__'):
+            raise AttributeError(msg) from err
 
-    This prevents sub-modules (geoms, stats, utils, ...)
-    from being imported into the user namespace by the
-    following import statement
+        try:
+            return import_module(f'.{name}', __name__)
+        except ModuleNotFoundError as err2:
+            if err2.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(msg) from err
 
-        from plotnine import *
+    obj = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = obj
+    return obj
 
-    This is because `from Module import Something`
-    leads to `Module` itself coming into the namespace!!
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
+
+class _LazyModule(ModuleType):
     """
-    from types import ModuleType
-    lst = [
-        name
-        for name, obj in globals().items()
-        if not (name.startswith('_') or isinstance(obj, ModuleType))
-    ]
-    return lst
+    Package module that keeps its public objects
+
+    Some objects have the same name as a submodule e.g. ``ggplot``
+    and ``plotnine.ggplot``. When such a submodule is imported,
+    python would otherwise replace the object with the submodule.
+    """
+    def __setattr__(self, name: str, value: Any):
+        if name in _LAZY and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
 
 
-__all__ = _get_all_imports()
+# Only the objects are imported by
+#
+#     from plotnine import *
+#
+# and not the submodules (geoms, stats, utils, ...)
+__all__ = list(_LAZY)
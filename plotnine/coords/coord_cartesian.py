@@ -3,17 +3,18 @@ from __future__ import annotations
 import typing
 from types import SimpleNamespace
 
+import numpy as np
 from mizani.bounds import squish_infinite
 from mizani.transforms import identity_trans
 
 from ..iapi import panel_view
+from ..mapping.aes import POSITION_AESTHETICS
 from ..positions.position import transform_position
 from .coord import coord, dist_euclidean
 
 if typing.TYPE_CHECKING:
     from typing import Optional
 
-    import numpy as np
     import numpy.typing as npt
     import pandas as pd
 
@@ -67,6 +68,10 @@ class coord_cartesian(coord):
                 range=panel_params.y.range
             )
 
+        # Without infinite values there is nothing to squish
+        if not _has_infinite_positions(data):
+            return data
+
         return transform_position(data, squish_infinite_x, squish_infinite_y)
 
     def setup_panel_params(
@@ -105,3 +110,20 @@ class coord_cartesian(coord):
             panel_params.y.range
         )[0]
         return dist_euclidean(x, y) / max_dist  # type: ignore
+
+
+def _has_infinite_positions(data: pd.DataFrame) -> bool:
+    """
+    Return True if any position aesthetic has infinite values
+
+    Columns whose values cannot be checked are assumed to
+    have infinite values.
+    """
+    for name in data.columns:
+        if name in POSITION_AESTHETICS:
+            try:
+                if np.isinf(data[name].to_numpy()).any():
+                    return True
+            except TypeError:
+                return True
+    return False
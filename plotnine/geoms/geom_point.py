@@ -4,10 +4,11 @@ import typing
 
 import matplotlib.lines as mlines
 import numpy as np
+import pandas as pd
 
 from ..doctools import document
 from ..scales.scale_shape import FILLED_SHAPES
-from ..utils import SIZE_FACTOR, to_rgba
+from ..utils import SIZE_FACTOR, to_rgba_compact
 from .geom import geom
 
 if typing.TYPE_CHECKING:
@@ -15,7 +16,6 @@ if typing.TYPE_CHECKING:
 
     import matplotlib as mpl
     import matplotlib.patches
-    import pandas as pd
 
     import plotnine as p9
 
@@ -60,9 +60,17 @@ class geom_point(geom):
         **params: Any
     ) -> None:
         data = coord.transform(data, panel_params)
-        units = 'shape'
-        for _, udata in data.groupby(units, dropna=False):
-            udata.reset_index(inplace=True, drop=True)
+        codes, shapes = pd.factorize(data['shape'], sort=True)
+
+        # Most often all the points have the same shape, there is
+        # no need to split up the data.
+        if len(shapes) == 1:
+            geom_point.draw_unit(data, panel_params, coord,
+                                 ax, **params)
+            return
+
+        for i in range(len(shapes)):
+            udata = data.iloc[np.flatnonzero(codes == i)]
             geom_point.draw_unit(udata, panel_params, coord,
                                  ax, **params)
 
@@ -79,27 +87,29 @@ class geom_point(geom):
         # gives a large enough scaling factor
         # All other sizes for which the MPL units should
         # be in points must scaled using sqrt(pi)
-        size = ((data['size']+data['stroke'])**2)*np.pi
-        stroke = data['stroke'] * SIZE_FACTOR
-        color = to_rgba(data['color'], data['alpha'])
-        shape = data.loc[0, 'shape']
+        stroke = data['stroke'].to_numpy()
+        size = np.square(data['size'].to_numpy() + stroke, dtype=float)
+        size *= np.pi
+        stroke = stroke * SIZE_FACTOR
+        color = to_rgba_compact(data['color'], data['alpha'])
+        shape = data['shape'].iloc[0]
 
         # It is common to forget that scatter points are
         # filled and slip-up by manually assigning to the
         # color instead of the fill. We forgive.
         if shape in FILLED_SHAPES:
-            if all(c is None for c in data['fill']):
+            if data['fill'].isna().all():
                 fill = color
             else:
-                fill = to_rgba(data['fill'], data['alpha'])
+                fill = to_rgba_compact(data['fill'], data['alpha'])
         else:
             # Assume unfilled
             fill = color
             color = None
 
         ax.scatter(
-            x=data['x'],
-            y=data['y'],
+            x=data['x'].to_numpy(),
+            y=data['y'].to_numpy(),
             s=size,
             facecolor=fill,
             edgecolor=color,
@@ -7,7 +7,7 @@ import numpy as np
 
 from ..coords import coord_flip
 from ..doctools import document
-from ..utils import SIZE_FACTOR, make_line_segments, to_rgba
+from ..utils import SIZE_FACTOR, to_rgba_compact
 from .geom import geom
 from .geom_path import geom_path
 
@@ -19,6 +19,9 @@ if typing.TYPE_CHECKING:
 
     import plotnine as p9
 
+# Sides onto which the rugs are drawn when the coordinates are flipped
+_FLIP_SIDES = str.maketrans('tblr', 'rlbt')
+
 
 @document
 class geom_rug(geom):
@@ -58,53 +61,65 @@ class geom_rug(geom):
         # coord_flip does not flip the side(s) on which the rugs
         # are plotted. We do the fliping here
         if isinstance(coord, coord_flip):
-            t = str.maketrans('tblr', 'rlbt')
-            sides = sides.translate(t)
-
-        data['size'] *= SIZE_FACTOR
+            sides = sides.translate(_FLIP_SIDES)
 
         has_x = 'x' in data.columns
         has_y = 'y' in data.columns
 
-        if has_x or has_y:
-            n = len(data)
-        else:
+        # The sides for which there is data, the x values
+        # are marked on the horizontal sides and the y values
+        # on the vertical sides
+        rug_sides = [
+            s for s in 'btlr'
+            if s in sides and (has_x if s in 'bt' else has_y)
+        ]
+
+        # Nothing to draw
+        if not rug_sides or params['length'] == 0:
             return
 
-        rugs = []
+        n = len(data)
         xmin, xmax = panel_params.x.range
         ymin, ymax = panel_params.y.range
         xheight = (xmax-xmin) * params['length']
         yheight = (ymax-ymin) * params['length']
+        ends = {
+            'b': (ymin, ymin+yheight),
+            't': (ymax-yheight, ymax),
+            'l': (xmin, xmin+xheight),
+            'r': (xmax-xheight, xmax)
+        }
+
+        # All the rugs go into one (m x 2 x 2) array of segments,
+        # with a block of n segments for each side
+        rugs = np.empty((len(rug_sides)*n, 2, 2))
+        for i, side in enumerate(rug_sides):
+            block = rugs[i*n:(i+1)*n]
+            if side in 'bt':
+                block[:, :, 0] = data['x'].to_numpy()[:, np.newaxis]
+                block[:, :, 1] = ends[side]
+            else:
+                block[:, :, 0] = ends[side]
+                block[:, :, 1] = data['y'].to_numpy()[:, np.newaxis]
+
+        # When the marks look the same, a single value is
+        # used for all the segments
+        color = to_rgba_compact(data['color'], data['alpha'])
+        if data['size'].nunique() == 1:
+            linewidth = data['size'].iloc[0] * SIZE_FACTOR
+        else:
+            linewidth = data['size'].to_numpy() * SIZE_FACTOR
+
+        if data['linetype'].nunique() == 1:
+            linestyle = data['linetype'].iloc[0]
+        else:
+            linestyle = data['linetype']
 
-        if has_x:
-            if 'b' in sides:
-                x = np.repeat(data['x'].to_numpy(), 2)
-                y = np.tile([ymin, ymin+yheight], n)
-                rugs.extend(make_line_segments(x, y, ispath=False))
-
-            if 't' in sides:
-                x = np.repeat(data['x'].to_numpy(), 2)
-                y = np.tile([ymax-yheight, ymax], n)
-                rugs.extend(make_line_segments(x, y, ispath=False))
-
-        if has_y:
-            if 'l' in sides:
-                x = np.tile([xmin, xmin+xheight], n)
-                y = np.repeat(data['y'].to_numpy(), 2)
-                rugs.extend(make_line_segments(x, y, ispath=False))
-
-            if 'r' in sides:
-                x = np.tile([xmax-xheight, xmax], n)
-                y = np.repeat(data['y'].to_numpy(), 2)
-                rugs.extend(make_line_segments(x, y, ispath=False))
-
-        color = to_rgba(data['color'], data['alpha'])
         coll = mcoll.LineCollection(
             rugs,
             edgecolor=color,
-            linewidth=data['size'],
-            linestyle=data['linetype'],
+            linewidth=linewidth,
+            linestyle=linestyle,
             zorder=params['zorder'],
             rasterized=params['raster']
         )
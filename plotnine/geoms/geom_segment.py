@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 
 from ..doctools import document
-from ..utils import SIZE_FACTOR, interleave, make_line_segments, to_rgba
+from ..utils import SIZE_FACTOR, to_rgba
 from .geom import geom
 from .geom_path import geom_path
 
@@ -58,18 +58,20 @@ class geom_segment(geom):
         **params: Any
     ) -> None:
         data = coord.transform(data, panel_params)
-        data['size'] *= SIZE_FACTOR
+        linewidth = data['size'].to_numpy() * SIZE_FACTOR
         color = to_rgba(data['color'], data['alpha'])
 
-        # start point -> end point, sequence of xy points
-        # from which line segments are created
-        x = interleave(data['x'], data['xend'])
-        y = interleave(data['y'], data['yend'])
-        segments = make_line_segments(x, y, ispath=False)
+        # (n x 2 x 2) array of segments, start point -> end point.
+        # Matplotlib creates a float64 path from each segment, with
+        # floats the paths are views and not copies.
+        segments = np.stack([
+            data[['x', 'y']].to_numpy(dtype=float),
+            data[['xend', 'yend']].to_numpy(dtype=float)
+        ], axis=1)
         coll = mcoll.LineCollection(
             segments,
             edgecolor=color,
-            linewidth=data['size'],
+            linewidth=linewidth,
             linestyle=data['linetype'][0],
             zorder=params['zorder'],
             rasterized=params['raster']
@@ -77,14 +79,21 @@ class geom_segment(geom):
         ax.add_collection(coll)
 
         if 'arrow' in params and params['arrow']:
-            adata = pd.DataFrame(index=range(len(data)*2))
-            idx = np.arange(1, len(data)+1)
-            adata['group'] = np.hstack([idx, idx])
-            adata['x'] = np.hstack([data['x'], data['xend']])
-            adata['y'] = np.hstack([data['y'], data['yend']])
-            other = ['color', 'alpha', 'size', 'linetype']
-            for param in other:
-                adata[param] = np.hstack([data[param], data[param]])
+            n = len(data)
+            # start points then end points
+            xy = np.concatenate([
+                data[['x', 'y']].to_numpy(),
+                data[['xend', 'yend']].to_numpy()
+            ])
+            adata = pd.DataFrame({
+                'group': np.tile(np.arange(1, n+1), 2),
+                'x': xy[:, 0],
+                'y': xy[:, 1],
+                'color': np.tile(data['color'].to_numpy(), 2),
+                'alpha': np.tile(data['alpha'].to_numpy(), 2),
+                'size': np.tile(linewidth, 2),
+                'linetype': np.tile(data['linetype'].to_numpy(), 2)
+            })
 
             params['arrow'].draw(
                 adata,
@@ -69,7 +69,9 @@ class geom_smooth(geom):
     ) -> None:
         has_ribbon = 'ymin' in data and 'ymax' in data
         if has_ribbon:
-            data2 = data.copy()
+            # The ribbon has no outline. A shallow copy is enough,
+            # setting columns on it does not affect the line data.
+            data2 = data.copy(deep=False)
             data2['color'] = 'none'
             params2 = params.copy()
             params2['outline_type'] = 'full'
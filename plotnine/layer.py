@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import os
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy, deepcopy
+from functools import lru_cache
 from typing import Iterable, List, overload
 
+import numpy as np
 import pandas as pd
 
 from .exceptions import PlotnineError
 from .mapping.aes import NO_GROUP, SCALED_AESTHETICS, aes
 from .mapping.evaluation import evaluate, stage
-from .utils import array_kind, check_required_aesthetics, ninteraction
+from .options import get_option
+from .utils import check_required_aesthetics, ninteraction
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Optional, Sequence, SupportsIndex
+    from typing import Any, Callable, Optional, Sequence, SupportsIndex
 
     from patsy.eval import EvalEnvironment
 
@@ -133,16 +138,39 @@ class layer:
     def __deepcopy__(self, memo: dict[Any, Any]) -> layer:
         """
         Deep copy without copying the self.data dataframe
+
+        The geom, stat and position are shallow copied and only
+        the dicts that may be modified when the plot is built are
+        deep copied.
         """
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         old = self.__dict__
         new = result.__dict__
+        components = ('geom', 'stat', 'position')
+
+        # The geom, stat and position refer to each other. They
+        # are all copied first so that those references can be
+        # pointed to the copies.
+        for key in components:
+            item = old[key]
+            if id(item) not in memo:
+                memo[id(item)] = copy(item)
 
         for key, item in old.items():
             if key == 'data':
                 new[key] = old[key]
+            elif key in components:
+                obj = new[key] = memo[id(item)]
+                for attr in ('params', 'mapping', 'aes_params'):
+                    if attr in item.__dict__:
+                        value = deepcopy(item.__dict__[attr], memo)
+                        setattr(obj, attr, value)
+                for attr in ('_stat', '_position'):
+                    if attr in item.__dict__:
+                        value = item.__dict__[attr]
+                        setattr(obj, attr, memo.get(id(value), value))
             else:
                 new[key] = deepcopy(old[key], memo)
 
@@ -167,7 +195,11 @@ class layer:
         plot_data : dataframe
             ggplot object data
         """
-        if plot_data is None:
+        # Most data are pandas dataframes, they are recognised
+        # before the checks for the other kinds of data.
+        if isinstance(plot_data, pd.DataFrame):
+            data = plot_data
+        elif plot_data is None:
             data = pd.DataFrame()
         elif callable(plot_data):
             data = plot_data()
@@ -178,10 +210,13 @@ class layer:
 
         # Each layer that does not have data gets a copy of
         # of the ggplot.data. If it has data it is replaced
-        # by copy so that we do not alter the users data
+        # by copy so that we do not alter the users data.
+        # The copies are shallow, the plot building process
+        # adds and replaces columns but it does not modify
+        # the values of the users columns.
         if self._data is None:
             try:
-                self.data = copy(data)
+                self.data = data.copy(deep=False)
             except AttributeError:
                 _geom_name = self.geom.__class__.__name__
                 _data_name = data.__class__.__name__
@@ -195,16 +230,15 @@ class layer:
                 raise PlotnineError(
                     "Data function must return a Pandas dataframe"
                 )
+        elif isinstance(self._data, pd.DataFrame):
+            self.data = self._data.copy(deep=False)
+        # Recognise polars dataframes
+        elif hasattr(self._data, "to_pandas"):
+            self.data = (
+                typing.cast("DataFrameConvertible", self._data).to_pandas()
+            )
         else:
-            # Recognise polars dataframes
-            if hasattr(self._data, "to_pandas"):
-                self.data = (
-                    typing.cast("DataFrameConvertible", self._data).to_pandas()
-                )
-            elif isinstance(self._data, pd.DataFrame):
-                self.data = self._data.copy()
-            else:
-                raise TypeError(f"Data has a bad type: {type(self.data)}")
+            raise TypeError(f"Data has a bad type: {type(self._data)}")
 
     def _make_layer_mapping(self, plot_mapping: aes) -> None:
         """
@@ -221,9 +255,8 @@ class layer:
         # aesthetics set as parameters override the same
         # aesthetics set as mappings, so we can ignore
         # those in the mapping
-        for ae in self.geom.aes_params:
-            if ae in self.mapping:
-                del self.mapping[ae]
+        for ae in self.mapping.keys() & self.geom.aes_params.keys():
+            del self.mapping[ae]
 
         # Set group as a mapping if set as a parameter
         if 'group' in self.geom.aes_params:
@@ -256,8 +289,9 @@ class layer:
         expression evaluation are  made in here
         """
         evaled = evaluate(self.mapping._starting, self.data, plot.environment)
-        evaled_aes = aes(**{str(col): col for col in evaled})
-        plot.scales.add_defaults(evaled, evaled_aes)
+        # The columns are already named after the aesthetics, so a
+        # plain dict is enough to add the default scales.
+        plot.scales.add_defaults(evaled, {ae: ae for ae in evaled})
 
         if len(self.data) == 0 and len(evaled) > 0:
             # No data, and vectors suppled to aesthetics
@@ -266,7 +300,7 @@ class layer:
             evaled['PANEL'] = self.data['PANEL']
 
         data = add_group(evaled)
-        self.data = data.sort_values('PANEL', kind='mergesort')
+        self.data = _sort_by_panel(data)
 
     def compute_statistic(self, layout: p9.facets.layout.Layout) -> None:
         """
@@ -302,9 +336,12 @@ class layer:
             stat_data = plot.scales.transform_df(stat_data)
 
         # When there are duplicate columns, we use the computed
-        # ones in stat_data
-        columns = data.columns.difference(stat_data.columns)
-        self.data = pd.concat([data[columns], stat_data], axis=1)
+        # ones in stat_data. Assigning the columns to a shallow copy
+        # is cheaper than concatenating the dataframes.
+        data = data.copy(deep=False)
+        for ae in stat_data.columns:
+            data[ae] = stat_data[ae]
+        self.data = data
 
         # Add any new scales, if needed
         new = {ae: ae for ae in stat_data.columns}
@@ -359,10 +396,12 @@ class layer:
         coord : coord
             Type of coordinate axes
         """
-        params = copy(self.geom.params)
-        params.update(self.stat.params)
-        params['zorder'] = self.zorder
-        params['raster'] = self.raster
+        params = {
+            **self.geom.params,
+            **self.stat.params,
+            'zorder': self.zorder,
+            'raster': self.raster
+        }
         self.data = self.geom.handle_na(self.data)
         # At this point each layer must have the data
         # that is created by the plot build process
@@ -472,17 +511,30 @@ class Layers(List[layer]):
         for l in self:
             l.compute_aesthetics(plot)
 
+    def _foreach(self, func: Callable[[layer], None]) -> None:
+        """
+        Call func on every layer
+
+        The layers are independent of each other, so if the
+        ``parallel_layers`` option is set, the calls are made
+        in a pool of threads.
+        """
+        if get_option('parallel_layers') and len(self) > 1:
+            # Consume the results to raise any exceptions
+            list(_layer_executor().map(func, self))
+        else:
+            for l in self:
+                func(l)
+
     def compute_statistic(self, layout: p9.facets.layout.Layout) -> None:
-        for l in self:
-            l.compute_statistic(layout)
+        self._foreach(lambda l: l.compute_statistic(layout))
 
     def map_statistic(self, plot: p9.ggplot) -> None:
         for l in self:
             l.map_statistic(plot)
 
     def compute_position(self, layout: p9.facets.layout.Layout) -> None:
-        for l in self:
-            l.compute_position(layout)
+        self._foreach(lambda l: l.compute_position(layout))
 
     def use_defaults(
         self,
@@ -524,8 +576,13 @@ def add_group(data: pd.DataFrame) -> pd.DataFrame:
         return data
 
     if 'group' not in data:
-        ignore = data.columns.difference(list(SCALED_AESTHETICS))
-        disc = discrete_columns(data, ignore=ignore)
+        ignore = [c for c in data.columns if c not in SCALED_AESTHETICS]
+        # Without any scaled aesthetics there is nothing to group by
+        if len(ignore) < len(data.columns):
+            disc = discrete_columns(data, ignore=ignore)
+        else:
+            disc = []
+
         if disc:
             data['group'] = ninteraction(data[disc], drop=True)
         else:
@@ -550,14 +607,45 @@ def discrete_columns(
     ignore : list[str]
         A list|set|tuple with the names of the columns to skip.
     """
+    ignore = set(ignore)
     lst = []
-    for col in df:
-        if array_kind.discrete(df[col]) and (col not in ignore):
-            # Some columns are represented as object dtype
-            # but may have compound structures as values.
+    for col, dtype in df.dtypes.items():
+        # Same test as array_kind.discrete, without creating a series
+        if col in ignore or dtype.kind not in 'ObUS':
+            continue
+
+        # Some columns are represented as object dtype
+        # but may have compound structures as values.
+        if dtype == np.dtype(object) and len(df):
             try:
-                hash(df[col].iloc[0])
+                hash(df[col].to_numpy()[0])
             except TypeError:
                 continue
-            lst.append(str(col))
+        lst.append(str(col))
     return lst
+
+
+@lru_cache(maxsize=None)
+def _layer_executor() -> ThreadPoolExecutor:
+    """
+    Return the thread pool used to compute layers in parallel
+    """
+    return ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+
+def _sort_by_panel(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stable sort of the data by the PANEL column
+
+    The data is returned as is if it is already sorted, which is
+    always the case for a single panel.
+    """
+    panel = data['PANEL']
+    if isinstance(panel.dtype, pd.CategoricalDtype):
+        key = panel.cat.codes.to_numpy()
+    else:
+        key = panel.to_numpy()
+
+    if (key[1:] >= key[:-1]).all():
+        return data
+    return data.take(np.argsort(key, kind='stable'))
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import numbers
 import typing
+from collections import ChainMap
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
@@ -231,7 +233,7 @@ def evaluate(
                 evaled[ae] = data[col]
             else:
                 try:
-                    new_val = env.eval(col, inner_namespace=data)
+                    new_val = _eval_expression(col, data, env)
                 except Exception as e:
                     raise PlotnineError(
                         _TPL_EVAL_FAIL.format(ae, col, str(e)))
@@ -263,6 +265,32 @@ def evaluate(
     return evaled
 
 
+@lru_cache(maxsize=128)
+def _compile_expression(expr: str, flags: int):
+    """
+    Compile an aesthetic expression
+
+    The same expressions are evaluated every time a plot is built,
+    so the code objects are cached.
+    """
+    return compile(expr, '<string>', 'eval', flags, False)
+
+
+def _eval_expression(
+    expr: str,
+    data: pd.DataFrame,
+    env: EvalEnvironment
+) -> Any:
+    """
+    Evaluate expression with the data columns as the inner namespace
+
+    This is what :meth:`EvalEnvironment.eval` does, but without
+    compiling the expression each time.
+    """
+    code = _compile_expression(expr, env.flags)
+    return eval(code, {}, ChainMap(data, env.namespace))
+
+
 def is_known_scalar(value):
     """
     Return True if value is a type we expect in a dataframe
@@ -29,6 +29,12 @@ SUBPLOTS_ADJUST = {
     'top': 0.88,  # the top of the subplots of the figure
 }
 
+#: Compute the statistics and positions of the layers in parallel
+#: threads. Results that depend on the global numpy random generator,
+#: e.g. :class:`~plotnine.positions.position_jitter` without a
+#: ``random_state``, are then not reproducible.
+parallel_layers = False
+
 
 def get_option(name: str) -> Any:
     """
@@ -11,7 +11,7 @@ import pandas as pd
 from mizani.bounds import censor, expand_range_distinct, rescale, zero_range
 from mizani.breaks import date_breaks
 from mizani.formatters import date_format
-from mizani.transforms import gettrans
+from mizani.transforms import gettrans, identity_trans
 
 from ..doctools import document
 from ..exceptions import PlotnineError, PlotnineWarning
@@ -750,6 +750,11 @@ class scale_continuous(scale):
         if len(df) == 0:
             return
 
+        # Most continuous scales are not transformed, there is no
+        # need to put back the same columns.
+        if type(self.trans) is identity_trans:
+            return df
+
         aesthetics = set(self.aesthetics) & set(df.columns)
         for ae in aesthetics:
             with suppress(TypeError):
@@ -59,15 +59,60 @@ class stat_count(stat):
             msg = 'stat_count() must not be used with a y aesthetic'
             raise PlotnineError(msg)
 
-        weight = data.get('weight', np.ones(len(x), dtype=int))
+        weight = data.get('weight')
         width = params['width']
-        df = pd.DataFrame({'weight': weight, 'x': x})
-        # weighted frequency count
-        count = df.pivot_table(
-            'weight', index=['x'], aggfunc=np.sum)['weight']
-        x = count.index
-        count = count.values
+        x, count = _weighted_count(x, weight)
+        # Only weighted counts can be negative
+        total = count.sum() if weight is None else np.abs(count).sum()
         return pd.DataFrame({'count': count,
-                             'prop': count / np.abs(count).sum(),
+                             'prop': count / total,
                              'x': x,
                              'width': width})
+
+
+def _weighted_count(x, weight=None):
+    """
+    Weighted frequency count of the unique values in x
+
+    Parameters
+    ----------
+    x : pandas.Series
+        Values to count
+    weight : pandas.Series, optional
+        Weight of each value. If None, each value has a weight of 1.
+
+    Returns
+    -------
+    out : tuple
+        Sorted unique values of x and the (weighted) count of each.
+    """
+    # The positions are numeric by the time the statistic is computed,
+    # so the counting can be done in numpy. Anything else e.g. a
+    # nullable extension dtype, goes through pandas.
+    if not _is_numpy_numeric(x) or (
+            weight is not None and not _is_numpy_numeric(weight)):
+        if weight is None:
+            weight = pd.Series(1, index=x.index)
+        count = weight.groupby(x, sort=True).sum()
+        return count.index.array, count.array
+
+    values, inverse = np.unique(x.to_numpy(), return_inverse=True)
+    if weight is None:
+        return values, np.bincount(inverse)
+
+    weight = weight.to_numpy()
+    # Like the pandas sum, missing weights do not add to the count
+    if weight.dtype.kind == 'f':
+        weight = np.where(np.isnan(weight), 0, weight)
+    count = np.bincount(inverse, weights=weight)
+    if weight.dtype.kind in 'biu':
+        # bincount always sums the weights as floats
+        count = count.astype(int)
+    return values, count
+
+
+def _is_numpy_numeric(s):
+    """
+    Return True if series s is backed by a numeric numpy array
+    """
+    return isinstance(s.dtype, np.dtype) and s.dtype.kind in 'biuf'
@@ -302,25 +302,17 @@ def ninteraction(df: pd.DataFrame, drop: bool = False) -> list[int]:
         return _id_var(df[df.columns[0]], drop)
 
     # Calculate individual ids
-    ids = df.apply(_id_var, axis=0)
-    ids = ids.reindex(columns=list(reversed(ids.columns)))
+    mat = np.array([_id_var(df[col]) for col in reversed(df.columns)]).T
 
     # Calculate dimensions
-    def len_unique(x):
-        return len(np.unique(x))
-    ndistinct = ids.apply(len_unique, axis=0).values
-
-    combs = np.array(
-        np.hstack([1, np.cumprod(ndistinct[:-1])])
-    )
-    mat = np.array(ids)
-    res = (mat - 1) @ combs.T + 1
-    res = np.array(res).flatten().tolist()
+    ndistinct = mat.max(axis=0)
+    combs = np.hstack([1, np.cumprod(ndistinct[:-1])])
+    res = (mat - 1) @ combs + 1
 
     if drop:
         return _id_var(res, drop)
     else:
-        return list(res)
+        return res.tolist()
 
 
 def _id_var(
@@ -358,13 +350,16 @@ def _id_var(
                 lst = list(x.cat.codes + 1)
     else:
         try:
-            levels = sorted(set(x))
+            codes, levels = pd.factorize(np.asarray(x), sort=True)
         except TypeError:
-            # x probably has NANs
+            # x probably has values that cannot be compared
             levels = multitype_sort(set(x))
+            lst = match(x, levels)  # type: ignore
+            return [item + 1 for item in lst]
 
-        lst = match(x, levels)  # type: ignore
-        lst = [item + 1 for item in lst]
+        # Missing values are -1, we give them the highest code
+        codes[codes == -1] = len(levels)
+        lst = (codes + 1).tolist()
 
     return lst
 
@@ -611,6 +606,30 @@ def to_rgba(colors, alpha):
             return to_rgba_hex(colors, alpha)
 
 
+def to_rgba_compact(colors, alpha):
+    """
+    Convert colors to rgba values, once if they are all the same
+
+    Parameters
+    ----------
+    colors : pandas.Series
+        colors to convert
+    alpha : pandas.Series
+        alpha values
+
+    Returns
+    -------
+    out : list | str
+        rgba color(s). If all the colors and alpha values
+        are the same, the list has a single color that
+        matplotlib applies to all the artists.
+    """
+    if (colors.nunique(dropna=False) == 1
+            and alpha.nunique(dropna=False) == 1):
+        return to_rgba(colors.iloc[:1], alpha.iloc[:1])
+    return to_rgba(colors, alpha)
+
+
 def groupby_apply(df, cols, func, *args, **kwargs):
     """
     Groupby cols and call the function fn on each grouped dataframe.
@@ -13,6 +13,7 @@ from plotnine import (
     theme,
 )
 from plotnine.stats.binning import freedman_diaconis_bins
+from plotnine.stats.stat_count import _weighted_count
 
 from .conftest import layer_data
 
@@ -80,6 +81,52 @@ def test_stat_count_float():
     assert p + _theme == 'stat-count-float'
 
 
+def test_stat_count_missing_weights():
+    # Missing weights do not add to the count
+    df = pd.DataFrame({
+        'x': [1, 1, 2, 2, 3],
+        'weight': [1, np.nan, 2, 3, 1]
+    })
+    p = ggplot(df, aes('x', weight='weight')) + geom_bar()
+    out = layer_data(p)
+
+    np.testing.assert_array_equal(out['x'], [1, 2, 3])
+    np.testing.assert_array_equal(out['count'], [1, 5, 1])
+    np.testing.assert_allclose(out['prop'], [1/7, 5/7, 1/7])
+
+
+def test_stat_count_int_weights():
+    df = pd.DataFrame({'x': [1, 1, 2], 'weight': [2, 3, 4]})
+    p = ggplot(df, aes('x', weight='weight')) + geom_bar()
+    out = layer_data(p)
+
+    assert out['count'].dtype.kind == 'i'
+    np.testing.assert_array_equal(out['count'], [5, 4])
+
+
+def test_stat_count_negative_weights():
+    df = pd.DataFrame({'x': [1, 2, 2], 'weight': [-1, 2, 3]})
+    p = ggplot(df, aes('x', weight='weight')) + geom_bar()
+    out = layer_data(p)
+
+    np.testing.assert_array_equal(out['count'], [-1, 5])
+    np.testing.assert_allclose(out['prop'], [-1/6, 5/6])
+
+
+def test_weighted_count_extension_dtypes():
+    # Nullable extension dtypes are counted with pandas
+    x = pd.Series([3, 1, pd.NA, 1, 2], dtype='Int64')
+    weight = pd.Series([1, 2, 5, pd.NA, 4], dtype='Int64')
+
+    values, count = _weighted_count(x)
+    np.testing.assert_array_equal(values, [1, 2, 3])
+    np.testing.assert_array_equal(count, [2, 1, 1])
+
+    values, count = _weighted_count(x, weight)
+    np.testing.assert_array_equal(values, [1, 2, 3])
+    np.testing.assert_array_equal(count, [2, 4, 1])
+
+
 def test_freedman_diaconis_bins():
     a1 = np.arange(1, 98, dtype=float)
     a2 = np.arange(100, dtype=float)
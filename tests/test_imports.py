@@ -0,0 +1,54 @@
+import subprocess
+import sys
+from importlib import import_module
+from types import ModuleType
+
+import pytest
+
+import plotnine
+from plotnine import _SUBMODULE_OBJECTS
+
+
+def test_lazy_objects_match_submodules():
+    # The objects listed for lazy import should be the
+    # public objects of each submodule
+    for module, names in _SUBMODULE_OBJECTS.items():
+        mod = import_module(f'plotnine.{module}')
+        public = getattr(mod, '__all__', names)
+        assert set(names) == set(public), module
+
+        for name in names:
+            assert getattr(plotnine, name) is getattr(mod, name)
+
+
+def test_objects_not_shadowed_by_submodules():
+    # These objects share a name with the submodule that
+    # defines them
+    import plotnine.ggplot  # noqa: F401
+    import plotnine.guides  # noqa: F401
+    import plotnine.qplot  # noqa: F401
+    import plotnine.watermark  # noqa: F401
+    from plotnine import ggplot, guides, qplot, watermark
+
+    assert isinstance(ggplot, type)
+    assert isinstance(guides, type)
+    assert not isinstance(qplot, ModuleType)
+    assert isinstance(watermark, type)
+
+
+def test_submodules_accessible_after_import():
+    # Run in a fresh interpreter, the submodules must not have
+    # been imported by anything else
+    code = (
+        'import plotnine as p9\n'
+        'assert p9.options.figure_size\n'
+        'assert p9.themes.theme_gray is p9.theme_gray\n'
+        'p9.options.figure_size = (3, 3)\n'
+        'assert p9.options.get_option("figure_size") == (3, 3)\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError):
+        plotnine.does_not_exist  # noqa: B018
@@ -1,12 +1,22 @@
+from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from plotnine import aes, geom_path, geom_point, ggplot
+from plotnine import (
+    aes,
+    facet_wrap,
+    geom_boxplot,
+    geom_path,
+    geom_point,
+    geom_violin,
+    ggplot,
+)
 from plotnine.exceptions import PlotnineError, PlotnineWarning
 from plotnine.layer import Layers, layer
+from plotnine.options import set_option
 
 df = pd.DataFrame({'x': range(10),
                    'y': range(10)})
@@ -105,6 +115,50 @@ def test_layer_with_nodata():
     assert "Could not evaluate the 'x' mapping:" in pe.value.message
 
 
+def test_layer_deepcopy():
+    p = ggplot(df, aes('x', 'y')) + geom_boxplot(aes(group='x'))
+    lyr = p.layers[0]
+    lyr2 = deepcopy(lyr)
+
+    for name in ('geom', 'stat', 'position'):
+        obj, obj2 = getattr(lyr, name), getattr(lyr2, name)
+        assert obj2 is not obj
+        assert obj2.params is not obj.params
+        assert obj2.params.keys() == obj.params.keys()
+
+    assert lyr2.stat.params['geom'] is lyr2.geom
+    assert lyr2.geom._stat is lyr2.stat
+    assert lyr2.geom._position is lyr2.position
+    assert lyr2.geom.mapping is not lyr.geom.mapping
+    assert lyr2.geom.aes_params is not lyr.geom.aes_params
+
+    # Changes to the original do not affect the copy
+    lyr.geom.params['width'] = 0.5
+    lyr.stat.params['coef'] = 3
+    assert lyr2.geom.params['width'] is None
+    assert lyr2.stat.params['coef'] == 1.5
+
+    # Building the plot does not affect the original
+    p.build_test()
+    assert lyr.stat.params['width'] is None
+
+
+def test_layer_data_does_not_modify_user_data():
+    data = pd.DataFrame({
+        'x': [1, 2, 3, 4],
+        'y': [4, 3, 2, 1],
+        'g': list('abab')
+    }, index=[5, 6, 7, 8])
+    expected = data.copy()
+
+    p = (ggplot(data, aes('x', 'y'))
+         + geom_point()
+         + geom_boxplot(data, aes(group='g'))
+         + facet_wrap('g'))
+    p.build_test()
+    pd.testing.assert_frame_equal(data, expected)
+
+
 class TestRasterizing:
     p = ggplot(df_large, aes('x', 'y'))
 
@@ -133,3 +187,21 @@ class TestRasterizing:
         p1 = self.p + geom_path()
         p2 = self.p + geom_path(raster=True)
         self._assert_raster_smaller(p1, p2)
+
+
+def test_parallel_layers():
+    p = (ggplot(df_large, aes('x', 'y'))
+         + geom_point()
+         + geom_boxplot(aes(group=1))
+         + geom_violin(aes(group=1))
+         )
+    data = [ld.copy() for ld in p.build_test().layers.data]
+
+    old = set_option('parallel_layers', True)
+    try:
+        pdata = p.build_test().layers.data
+    finally:
+        set_option('parallel_layers', old)
+
+    for ld, pld in zip(data, pdata):
+        pd.testing.assert_frame_equal(ld, pld)
@@ -133,6 +133,10 @@ def test_ninteraction():
     df = pd.DataFrame({'a': ['b']})
     assert ninteraction(df) == [1]
 
+    # missing values get the highest id
+    df = pd.DataFrame({'a': [2, np.nan, 1, np.nan]})
+    assert ninteraction(df) == [2, 3, 1, 3]
+
 
 def test_ninteraction_datetime_series():
     # When a pandas datetime is converted Numpy datetime, the two